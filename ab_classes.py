@@ -1,8 +1,11 @@
 from collections import UserDict
 from datetime import datetime, date
-import re
-import pickle
+from pathlib import Path
+import bisect
+import functools
+import json
 import itertools
+import os
 
 
 class BirthdayError(Exception):
@@ -17,7 +20,20 @@ class NotValidNumber(Exception):
     ...
 
 
+class EmptyFileError(Exception):
+    ...
+
+
+@functools.lru_cache(maxsize=512)
+def _days_to(today_ord, month, day):
+    current_date = date.fromordinal(today_ord)
+    passed = (month, day) < (current_date.month, current_date.day)
+    return date(current_date.year + passed, month, day).toordinal() - today_ord
+
+
 class Field:
+    __slots__ = ("_value",)
+
     def __init__(self, value) -> None:
         self._value = value
 
@@ -31,46 +47,48 @@ class Field:
 
 
 class Name(Field):
+    __slots__ = ()
+
+    def __hash__(self):
+        return hash(self._value)
+
+    def __eq__(self, other):
+        if isinstance(other, Name):
+            return self._value == other._value
+        return self._value == other
+
     def __str__(self):
-        return self.value
+        return self._value
 
 
 class Phone(Field):
+    __slots__ = ()
+
     def __init__(self, value=None):
-        self._value = None
         if value is not None:
-            self.value = value
+            self._validate_phone(value)
+        self._value = value
 
     def _validate_phone(self, value):
-        if not re.match(r"^\d{7,15}$", value):
+        if not (7 <= len(value) <= 15 and value.isdecimal()):
             raise ValueError("Invalid phone number format")
 
     @property
     def value(self):
         return self._value
 
-    @value.setter
-    def value(self, new_value):
-        self._validate_phone(new_value)
-        self._value = new_value
-
     def __repr__(self) -> str:
         return str(self)
 
     def __str__(self) -> str:
-        return self.value
+        return self._value
 
 
 class Birthday(Field):
-    def __init__(self, value):
-        self._validate_birthday(value)
-        self._value = datetime.strptime(value, "%d-%m-%Y").date()
+    __slots__ = ()
 
-    def _validate_birthday(self, value):
-        try:
-            datetime.strptime(value, "%d-%m-%Y")
-        except ValueError:
-            raise BirthdayError("Invalid birthday format. Use DD-MM-YYYY format.")
+    def __init__(self, value):
+        self.value = value
 
     @property
     def value(self):
@@ -78,29 +96,37 @@ class Birthday(Field):
 
     @value.setter
     def value(self, new_value):
-        self._validate_birthday(new_value)
-        self._value = datetime.strptime(new_value, "%d-%m-%Y").date()
+        try:
+            self._value = datetime.strptime(new_value, "%d-%m-%Y").date()
+        except ValueError:
+            raise BirthdayError("Invalid birthday format. Use DD-MM-YYYY format.")
 
-    def days_to_birthday(self):
+    def days_to_birthday(self, today=None):
         if not self._value:
             return None
 
-        current_date = datetime.now().date()
-        given_date = date(current_date.year, self._value.month, self._value.day)
-        if given_date < current_date:
-            given_date = date(current_date.year + 1, self._value.month, self._value.day)
+        if today is None:
+            today = date.today()
+        return _days_to(today.toordinal(), self._value.month, self._value.day)
 
-        delta = given_date - current_date
-        return delta.days
+    @classmethod
+    def from_iso(cls, value):
+        birthday = cls.__new__(cls)
+        birthday._value = date.fromisoformat(value)
+        return birthday
 
     def __str__(self) -> str:
         return self._value.strftime("%d-%m-%Y") if self._value else ""
 
 
 class Record:
+    __slots__ = ("name", "phones", "birthday", "_str_cache", "_book")
+
     def __init__(self, name, phone=None, birthday=None):
         self.name = name
         self.phones = []
+        self._str_cache = None
+        self._book = None
         if phone:
             self.add_phone(phone)
         self.birthday = Birthday(birthday) if birthday else None
@@ -108,6 +134,7 @@ class Record:
     def add_phone(self, phone: Phone):
         if phone not in self.phones:
             self.phones.append(phone)
+            self._changed()
             return f"Phone {phone} added to contact {self.name}"
 
         return f"Phone {phone} already present in contact {self.name}"
@@ -116,19 +143,54 @@ class Record:
         for idx, phone in enumerate(self.phones):
             if old_phone.value == phone.value:
                 self.phones[idx] = new_phone
+                self._changed()
                 return f"Old phone {old_phone} changed to {new_phone}"
 
         return f"{old_phone} not present in phonebook"
 
     def change_birthday(self, new_birthday):
         self.birthday = Birthday(new_birthday)
+        self._changed()
+
+    def _changed(self):
+        self._str_cache = None
+        if self._book is not None:
+            self._book.invalidate_search()
 
     def __str__(self):
-        phone_str = ", ".join(str(phone) for phone in self.phones)
-        contact_str = f"{self.name}: [{phone_str}]"
-        if self.birthday:
-            contact_str += f" (Birthday: {self.birthday})"
-        return contact_str
+        if self._str_cache is None:
+            phone_str = ", ".join(str(phone) for phone in self.phones)
+            contact_str = f"{self.name}: [{phone_str}]"
+            if self.birthday:
+                contact_str += f" (Birthday: {self.birthday})"
+            self._str_cache = contact_str
+        return self._str_cache
+
+    def to_primitive(self):
+        phones = [str(phone) for phone in self.phones]
+        birthday = self.birthday.value.isoformat() if self.birthday else None
+        return self.name.value, phones, birthday
+
+    @classmethod
+    def from_primitive(cls, data):
+        try:
+            name, phones, birthday = data
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid record: {data!r}")
+        if (
+            not isinstance(name, str)
+            or not isinstance(phones, list)
+            or not all(isinstance(phone, str) for phone in phones)
+            or not isinstance(birthday, (str, type(None)))
+        ):
+            raise ValueError(f"Invalid record: {data!r}")
+
+        record = cls(Name(name))
+        for phone in phones:
+            record.add_phone(Phone(phone))
+        if birthday is not None:
+            record.birthday = Birthday.from_iso(birthday)
+        return record
 
     def birthday_info(self):
         if self.birthday:
@@ -141,60 +203,107 @@ class Record:
 class AddressBook(UserDict):
     def __init__(self, *args, page_size=5, **kwargs):
         self.page_size = page_size
+        self._concat = None
+        self._offsets = []
+        self._offset_names = []
         super().__init__(*args, **kwargs)
 
+    def __setitem__(self, key, record):
+        self.data[key] = record
+        if isinstance(record, Record):
+            record._book = self
+        self.invalidate_search()
+
+    def __delitem__(self, key):
+        del self.data[key]
+        self.invalidate_search()
+
+    def clear(self):
+        self.data.clear()
+        self.invalidate_search()
+
     def add_record(self, record: Record):
-        self.data[str(record.name)] = record
+        self[record.name.value] = record
         return f"Contact {record.name} added"
 
+    def invalidate_search(self):
+        self._concat = None
+
+    def _build_concat(self):
+        parts = []
+        self._offsets = []
+        self._offset_names = []
+        pos = 0
+        for name, record in self.data.items():
+            text = str(record)
+            parts.append(text)
+            self._offsets.append(pos)
+            self._offset_names.append(name)
+            pos += len(text) + 1
+        self._concat = "\n".join(parts)
+
+    def search(self, query):
+        if not self.data:
+            return []
+        if self._concat is None:
+            self._build_concat()
+
+        result = []
+        last = len(self._offsets) - 1
+        idx = self._concat.find(query)
+        while idx != -1:
+            pos = bisect.bisect_right(self._offsets, idx) - 1
+            if pos == last:
+                end = len(self._concat)
+            else:
+                end = self._offsets[pos + 1] - 1
+            if idx + len(query) > end:
+                idx = self._concat.find(query, idx + 1)
+                continue
+            record = self.data.get(self._offset_names[pos])
+            if record is not None:
+                result.append(record)
+            if pos == last:
+                break
+            idx = self._concat.find(query, end + 1)
+        return result
+
     def del_record(self, name):
-        if name in self.data:
-            del self.data[name]
+        if self.pop(name, None) is not None:
             return f"Contact {name} deleted"
         return f"Contact {name} does not exist in the phonebook"
 
-    def load_address_book(self):
-        path = input(
-            'Input path for address book (Default path is "addressbook.pkl"): '
-        )
-        if not path:
-            path = "addressbook.pkl"
-        try:
-            with open(path, "r+b") as file:
-                try:
-                    self.data = pickle.load(file)
-                except EOFError:
-                    print(f"File '{path}' is empty. Creating an empty address book.")
-                    self.data = AddressBook()
-        except FileNotFoundError:
-            print(f"File '{path}' not found. Creating an empty address book.")
-            self.data = AddressBook()
+    def load_from(self, path):
+        self.clear()
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+
+        payload = Path(path).read_bytes()
+        if not payload.strip():
+            raise EmptyFileError(path)
+        records = json.loads(payload)
+        if not isinstance(records, list):
+            raise ValueError(f"File '{path}' does not contain an address book")
+        for item in records:
+            self.add_record(Record.from_primitive(item))
         return self
 
-    def save_address_book(self, path=None):
-        if not path:
-            path = input('Input path for saving (Default path is "addressbook.pkl"): ')
-        if not path:
-            path = "addressbook.pkl"
+    def save_to(self, path):
+        records = [record.to_primitive() for record in self.data.values()]
+        payload = json.dumps(records, ensure_ascii=False, separators=(",", ":"))
         with open(path, "wb") as file:
-            pickle.dump(self.data, file)
-
-    def del_record(self, name):
-        if name in self.data:
-            del self.data[name]
-        return f"Contact {name} does not exist in the phonebook"
+            file.write(payload.encode("utf-8"))
 
     def values(self):
         return iter(self.data.values())
 
     def iterator(self):
-        total_records = len(self.data)
-        current_page = 0
-        while current_page < total_records:
-            yield itertools.islice(
-                self.values(), current_page, current_page + self.page_size
-            )
-            current_page += self.page_size
+        it = iter(self.data.values())
+        while True:
+            chunk = list(itertools.islice(it, self.page_size))
+            if not chunk:
+                return
+            yield chunk
 
     def __iter__(self):
         return iter(self.data.values())
@@ -1,3 +1,5 @@
+from datetime import date
+
 from ab_classes import (
     AddressBook,
     Name,
@@ -5,6 +7,7 @@ from ab_classes import (
     Record,
     BirthdayError,
     DuplicatePhoneError,
+    EmptyFileError,
 )
 
 address_book = AddressBook()
@@ -50,7 +53,7 @@ def add_command(*args):
     else:
         birth = None
 
-    rec: Record = address_book.get(str(name))
+    rec: Record = address_book.get(name)
     if rec:
         try:
             rec.add_phone(phone)
@@ -67,14 +70,36 @@ def change_command(*args):
     name = Name(args[0])
     old_phone = Phone(args[1])
     new_phone = Phone(args[2])
-    rec: Record = address_book.get(str(name))
+    rec: Record = address_book.get(name)
     if rec:
         return rec.change_phone(old_phone, new_phone)
     return f"No contact {name} in address book"
 
 
+def load_address_book():
+    while True:
+        path = input(
+            'Input path for address book (Default path is "addressbook.json"): '
+        )
+        if not path:
+            path = "addressbook.json"
+        try:
+            return address_book.load_from(path)
+        except FileNotFoundError:
+            print(f"File '{path}' not found. Creating an empty address book.")
+        except EmptyFileError:
+            print(f"File '{path}' is empty. Creating an empty address book.")
+        except ValueError:
+            print(f"File '{path}' is not a valid address book. Choose another file.")
+            continue
+        return address_book
+
+
 def exit_command():
-    address_book.save_address_book()
+    path = input('Input path for saving (Default path is "addressbook.json"): ')
+    if not path:
+        path = "addressbook.json"
+    address_book.save_to(path)
     return "Bye"
 
 
@@ -83,11 +108,15 @@ def unknown_command(*args):
     return f"Unknown command: {args[0]}"
 
 
+def missing_args_command(*args):
+    return (
+        f"Please provide the necessary parameters for '{args[0]}'. "
+        "Type 'help' for usage"
+    )
+
+
 @input_error
 def get_phone_command(*args):
-    if len(args) != 1:
-        return "Invalid arguments. Usage: get <contact_name>"
-
     contact_name = args[0]
     rec: Record = address_book.get(contact_name)
     if rec:
@@ -105,9 +134,8 @@ def find_command(*args):
     search = args[0]
     if len(search) < 3:
         return "Invalid arguments. Usage: find <minimum 3 symbols>"
-    for i in address_book:
-        if search in str(i):
-            result.append(str(i))
+    for i in address_book.search(search):
+        result.append(str(i))
     if result:
         return "\n".join(result)
     else:
@@ -125,62 +153,86 @@ def show_all_command(*args):
     elif len(args) == 1:
         start_page = int(args[0])
         end_page = start_page
-    elif len(args) == 2:
+    else:
         start_page = int(args[0])
         end_page = int(args[1])
-    else:
-        return "Invalid arguments. Usage: show all [start_page [end_page]]"
 
-    all_contacts = ""
+    today = date.today()
+    parts = []
     for page, records in enumerate(address_book.iterator(), start=1):
         if start_page <= page <= end_page:
-            all_contacts += f"Page {page}:\n"
+            parts.append(f"Page {page}:\n")
             for record in records:
-                contact_str = str(record)
+                parts.append(str(record))
                 if record.birthday:
-                    contact_str += f" (Days to birthday: {record.birthday.days_to_birthday()})"  # Birthday: {record.birthday},
-                all_contacts += contact_str + "\n"
-            all_contacts += "\n"
+                    parts.append(
+                        f" (Days to birthday: {record.birthday.days_to_birthday(today)})"
+                    )
+                parts.append("\n")
+            parts.append("\n")
 
-    return all_contacts
+    return "".join(parts)
 
 
 @input_error
 def delete_command(*args):
     contact_name = str(args[0])
-    if contact_name in address_book:
-        confirmation = input(f"Are you sure delete {contact_name}: Yes/No :").lower()
-        if confirmation == "yes":
-            address_book.del_record(contact_name)
-            return f"Contact {contact_name} deleted"
-
-    else:
+    if contact_name not in address_book:
         return f"Contact {contact_name} not found in the address book"
 
+    confirmation = input(f"Are you sure delete {contact_name}: Yes/No :").lower()
+    if confirmation == "yes":
+        return address_book.del_record(contact_name)
+    return f"Contact {contact_name} not deleted"
+
 
 COMMANDS = {
-    add_command: ("add", "+"),
-    change_command: ("change", "зміни"),
-    exit_command: ("bye", "exit", "end", "вихід"),
-    show_all_command: ("show all", "покажи все"),
-    delete_command: ("del", "delete", "видали"),
-    get_phone_command: ("get", "дай"),
-    find_command: ("search", "find", "знайди"),
-    help_command: ("help"),
+    add_command: (("add", "+"), 2, 3),
+    change_command: (("change", "зміни"), 3, 3),
+    exit_command: (("bye", "exit", "end", "вихід"), 0, 0),
+    show_all_command: (("show all", "покажи все"), 0, 2),
+    delete_command: (("del", "delete", "видали"), 1, 1),
+    get_phone_command: (("get", "дай"), 1, 1),
+    find_command: (("search", "find", "знайди"), 1, 1),
+    help_command: (("help",), 0, 0),
+}
+
+_DISPATCH = {
+    kwd: (cmd, min_args, max_args)
+    for cmd, (kwds, min_args, max_args) in COMMANDS.items()
+    for kwd in kwds
 }
 
+_KWD_TO_CMD = sorted(_DISPATCH.items(), key=lambda kv: -len(kv[0]))
+
+
+def _match_command(text):
+    words = text.split()
+    for size in (2, 1):
+        kwd = " ".join(words[:size]).lower()
+        if kwd in _DISPATCH:
+            return kwd, _DISPATCH[kwd], words[size:]
+
+    low = text.lower()
+    for kwd, spec in _KWD_TO_CMD:
+        if low.startswith(kwd):
+            return kwd, spec, text[len(kwd) :].split()
+    return None
+
 
 def parser(text):
-    for cmd, kwds in COMMANDS.items():
-        for kwd in kwds:
-            if text.lower().startswith(kwd):
-                data = text[len(kwd) :].strip().split()
-                return cmd, data
-    return unknown_command, [text]
+    match = _match_command(text)
+    if match is None:
+        return unknown_command, [text]
+
+    kwd, (cmd, min_args, max_args), data = match
+    if len(data) < min_args:
+        return missing_args_command, [kwd]
+    return cmd, data[:max_args]
 
 
 def main():
-    address_book.load_address_book()
+    load_address_book()
     print("'help' for more information")
     while True:
         user_input = input("Wait...>")